@@ -1,154 +1,538 @@
-import requests
+import asyncio
 from datetime import datetime, timedelta
-import calendar
+import hashlib
+import httpx
+import itertools
 import os
-from typing import Dict, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 import logging
-from collections import defaultdict
-import statistics
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+import numpy as np
+import orjson
+import pandas as pd
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
 logger = logging.getLogger(__name__)
 
+@contextmanager
+def queued_logging():
+    """Hand log records to a background thread so handler I/O stays off the event loop."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.handlers = handlers
+
+# Transient server errors worth retrying, with exponential backoff between attempts
+RETRY_STATUSES = {502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+REQUEST_TIMEOUT = 30.0
+
+# Pause until the rate limit resets once this few requests remain in the window
+RATE_LIMIT_THRESHOLD = 10
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+# The search API only serves the first 1000 results of a query
+SEARCH_RESULT_LIMIT = 1000
+
+# Walks the default branch history of one repository, filtered to a single author
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $author: ID!, $since: GitTimestamp!, $until: GitTimestamp!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: $cursor, since: $since, until: $until, author: {id: $author}) {
+            nodes { oid additions deletions authoredDate }
+            pageInfo { endCursor hasNextPage }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 class GitHubStats:
-    def __init__(self, token: str):
+    def __init__(self, token: str, cache_dir: Optional[str] = None):
         self.token = token
         self.headers = {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         }
         self.base_url = 'https://api.github.com'
+        self.max_concurrency = 10
+        self.client: Optional[httpx.AsyncClient] = None
+        self._request_sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Epoch time until which no request may be sent, shared by all concurrent tasks
+        self._rate_limited_until = 0.0
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.cache', 'github_stats')
+        self._repo_cache: Dict[str, asyncio.Future] = {}
+        self._user_id_cache: Dict[str, asyncio.Future] = {}
         logger.info("GitHubStats initialized")
 
-    def get_org_repos(self, org: str) -> List[str]:
-        """Get all repositories in an organization."""
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use in each event loop.
+
+        The client speaks HTTP/2, so concurrent requests are multiplexed over a single connection.
+        """
+        loop = asyncio.get_running_loop()
+        if self.client is None or self.client.is_closed or self._loop is not loop:
+            # A client left over from an earlier asyncio.run() is bound to a closed loop and is dropped
+            self._loop = loop
+            self.client = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=self.max_concurrency,
+                                    max_keepalive_connections=self.max_concurrency),
+                timeout=REQUEST_TIMEOUT
+            )
+            self._request_sem = asyncio.Semaphore(self.max_concurrency)
+        return self.client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and its connections."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying transient server and connection errors."""
+        client = self._get_client()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._request_sem:
+                    await self._wait_for_rate_limit()
+                    response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                # Timeouts, connection resets and dropped HTTP/2 connections
+                if attempt == MAX_RETRIES:
+                    raise
+                error = type(e).__name__
+            else:
+                if self._handle_rate_limit(response) and attempt < MAX_RETRIES:
+                    continue
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return response
+                error = response.status_code
+            delay = BACKOFF_FACTOR * (2 ** attempt)
+            logger.warning(f"Got {error} from {url}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Sleep until any rate limit pause set by an earlier response has passed."""
+        delay = self._rate_limited_until - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _handle_rate_limit(self, response: httpx.Response) -> bool:
+        """Pause all requests for the rate limit signalled by a response.
+
+        Returns True if the request was rejected by the rate limit and should be retried.
+        """
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining')
+        running_low = remaining is not None and int(remaining) < RATE_LIMIT_THRESHOLD and 'X-RateLimit-Reset' in headers
+        reset_wait = max(0.0, float(headers['X-RateLimit-Reset']) - time.time()) if running_low else 0.0
+        rejected = response.status_code in (403, 429) and (
+            'Retry-After' in headers
+            or remaining == '0'
+            or 'rate limit' in response.text.lower()
+        )
+        if rejected and 'Retry-After' in headers:
+            delay = float(headers['Retry-After'])
+        elif rejected:
+            delay = max(SECONDARY_RATE_LIMIT_WAIT, reset_wait)
+        elif running_low:
+            delay = reset_wait
+        else:
+            return False
+        
+        until = time.time() + delay
+        if until > self._rate_limited_until:
+            logger.warning(f"Rate limit reached, pausing requests for {delay:.0f}s")
+            self._rate_limited_until = until
+        return rejected
+
+    async def _get(self, url: str, params: Optional[Dict] = None,
+                   headers: Optional[Dict] = None) -> httpx.Response:
+        """GET a URL from the REST API."""
+        return await self._request('GET', url, params=params, headers=headers)
+
+    async def _graphql(self, query: str, variables: Dict) -> Optional[Dict]:
+        """Run a GraphQL query, returning its data or None if the request failed."""
+        response = await self._request('POST', f'{self.base_url}/graphql',
+                                       content=orjson.dumps({'query': query, 'variables': variables}),
+                                       headers={'Content-Type': 'application/json'})
+        if response.status_code != 200:
+            logger.warning(f"GraphQL request failed with {response.status_code}: {response.text}")
+            return None
+        
+        result = orjson.loads(response.content)
+        if result.get('errors'):
+            logger.warning(f"GraphQL query returned errors: {result['errors']}")
+            return None
+        return result['data']
+
+    def _read_cache(self, path: str) -> Optional[Dict]:
+        """Load a JSON cache file, returning None if it is missing or unreadable."""
+        try:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path: str, data: Dict) -> None:
+        """Atomically write a JSON cache file."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {path}: {e}")
+
+    async def _get_listing_page(self, url: str, params: Optional[Dict] = None,
+                                extract: Optional[Callable[[Any], Any]] = None
+                                ) -> Tuple[httpx.Response, Optional[Any], Optional[str]]:
+        """GET one page of a list endpoint, revalidating the copy cached by a previous run.
+
+        Returns the response, the (optionally extracted) page or None on failure, and the
+        URL of the next page from the Link header, if any.
+        """
+        key = hashlib.sha1(orjson.dumps([url, params], option=orjson.OPT_SORT_KEYS)).hexdigest()
+        cache_path = os.path.join(self.cache_dir, 'pages', key[:2], f'{key}.json')
+        cached = await asyncio.to_thread(self._read_cache, cache_path)
+        
+        response = await self._get(url, params=params,
+                                   headers={'If-None-Match': cached['etag']} if cached else None)
+        if response.status_code == 304:
+            return response, cached['body'], cached.get('next')
+        if response.status_code != 200:
+            return response, None, None
+        
+        page = orjson.loads(response.content)
+        if extract is not None:
+            page = extract(page)
+        next_url = response.links.get('next', {}).get('url')
+        etag = response.headers.get('ETag')
+        if etag:
+            await asyncio.to_thread(self._write_cache, cache_path, {'etag': etag, 'body': page, 'next': next_url})
+        return response, page, next_url
+
+    @staticmethod
+    async def _memoized(cache: Dict[str, asyncio.Future], key: str, factory: Callable[[], Awaitable]) -> Any:
+        """Await a shared lookup, starting it if needed. Failed lookups are evicted so they can be retried."""
+        future = cache.get(key)
+        if future is None:
+            future = cache[key] = asyncio.ensure_future(factory())
+        try:
+            return await future
+        except BaseException:
+            if cache.get(key) is future:
+                del cache[key]
+            raise
+
+    async def get_org_repos(self, org: str) -> List[str]:
+        """Get all repositories in an organization. Results are cached per organization."""
+        return await self._memoized(self._repo_cache, org, lambda: self._list_org_repos(org))
+
+    async def _list_org_repos(self, org: str) -> List[str]:
+        """List the names of an organization's repositories."""
         logger.info(f"Fetching repositories for organization: {org}")
         repos = []
         page = 1
-        while True:
+        url = f'{self.base_url}/orgs/{org}/repos'
+        params = {'per_page': 100}
+        while url:
             logger.info(f"Fetching page {page} of repositories")
-            response = requests.get(
-                f'{self.base_url}/orgs/{org}/repos',
-                headers=self.headers,
-                params={'page': page, 'per_page': 100}
+            response, page_repos, url = await self._get_listing_page(
+                url, params=params,
+                extract=lambda data: [repo['name'] for repo in data]
             )
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch repos: {response.text}")
-                raise Exception(f"Failed to fetch repos: {response.text}")
+            if page_repos is None:
+                text = response.text
+                logger.error(f"Failed to fetch repos: {text}")
+                raise Exception(f"Failed to fetch repos: {text}")
             
-            data = response.json()
-            if not data:
-                break
-                
-            repos.extend([repo['name'] for repo in data])
-            logger.info(f"Found {len(data)} repositories on page {page}")
+            # Next links already carry the query string
+            params = None
+            repos.extend(page_repos)
+            logger.info(f"Found {len(page_repos)} repositories on page {page}")
             page += 1
             
         logger.info(f"Total repositories found: {len(repos)}")
         return repos
 
-    def get_user_commits(self, org: str, username: str, start_date: datetime, end_date: datetime) -> List[Dict]:
+    async def _search_active_repos(self, org: str, username: str,
+                                   start_date: datetime, end_date: datetime) -> Optional[List[str]]:
+        """Find the repositories a user committed to within a date range via commit search.
+
+        Returns None if the search failed or its results are incomplete.
+        """
+        logger.info(f"Searching commits by {username} in {org}")
+        last_day = end_date - timedelta(days=1)
+        url = f'{self.base_url}/search/commits'
+        params = {
+            'q': f'author:{username} org:{org} committer-date:{start_date:%Y-%m-%d}..{last_day:%Y-%m-%d}',
+            'per_page': 100
+        }
+        repos = set()
+        while url:
+            response = await self._get(url, params=params)
+            if response.status_code != 200:
+                logger.warning(f"Commit search failed: {response.text}")
+                return None
+            
+            data = orjson.loads(response.content)
+            if data['incomplete_results'] or data['total_count'] > SEARCH_RESULT_LIMIT:
+                logger.info("Commit search results are incomplete")
+                return None
+            
+            repos.update(item['repository']['name'] for item in data['items'])
+            url = response.links.get('next', {}).get('url')
+            params = None
+        
+        logger.info(f"Found commits in {len(repos)} repositories")
+        return sorted(repos)
+
+    async def _get_active_repos(self, org: str, username: str, start_date: datetime, end_date: datetime) -> List[str]:
+        """Get the repositories worth scanning, falling back to every repository in the organization."""
+        repos = await self._search_active_repos(org, username, start_date, end_date)
+        if repos is None:
+            repos = await self.get_org_repos(org)
+        return repos
+
+    async def _fetch_repo_commits(self, org: str, repo: str, username: str, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Get all commits by a user in a single repository within a date range."""
+        logger.info(f"Checking commits in repository: {repo}")
+        commits = []
+        page = 1
+        url = f'{self.base_url}/repos/{org}/{repo}/commits'
+        params = {
+            'author': username,
+            'since': start_date.isoformat(),
+            'until': end_date.isoformat(),
+            'per_page': 100
+        }
+        while url:
+            logger.info(f"Fetching page {page} of commits for {repo}")
+            response, data, url = await self._get_listing_page(url, params=params)
+            if data is None:
+                logger.warning(f"Failed to fetch commits for {repo}: {response.text}")
+                break
+            
+            params = None
+            commits.extend(data)
+            logger.info(f"Found {len(data)} commits on page {page} for {repo}")
+            page += 1
+        return commits
+
+    async def get_user_commits(self, org: str, username: str, start_date: datetime, end_date: datetime) -> List[Dict]:
         """Get all commits by a user in an organization's repositories within a date range."""
         logger.info(f"Fetching commits for user {username} from {start_date} to {end_date}")
-        all_commits = []
-        repos = self.get_org_repos(org)
+        repos = await self._get_active_repos(org, username, start_date, end_date)
         
-        for repo in repos:
-            logger.info(f"Checking commits in repository: {repo}")
-            page = 1
-            while True:
-                logger.info(f"Fetching page {page} of commits for {repo}")
-                response = requests.get(
-                    f'{self.base_url}/repos/{org}/{repo}/commits',
-                    headers=self.headers,
-                    params={
-                        'author': username,
-                        'since': start_date.isoformat(),
-                        'until': end_date.isoformat(),
-                        'page': page,
-                        'per_page': 100
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.warning(f"Failed to fetch commits for {repo}: {response.text}")
-                    break
-                
-                data = response.json()
-                if not data:
-                    break
-                    
-                all_commits.extend(data)
-                logger.info(f"Found {len(data)} commits on page {page} for {repo}")
-                page += 1
+        results = await asyncio.gather(*[
+            self._fetch_repo_commits(org, repo, username, start_date, end_date)
+            for repo in repos
+        ])
+        all_commits = list(itertools.chain.from_iterable(results))
                 
         logger.info(f"Total commits found: {len(all_commits)}")
         return all_commits
 
-    def get_commit_stats(self, org: str, username: str, year: int, month: int) -> Tuple[int, int, Dict]:
-        """Get total additions and deletions for a user in a specific month."""
-        logger.info(f"Calculating stats for {username} in {org} for {year}-{month}")
-        # Calculate date range
+    async def _fetch_commit_detail(self, org: str, repo: str, sha: str) -> Optional[Dict]:
+        """Fetch the detailed stats for a single commit.
+
+        Commits are immutable, so stats are cached on disk by SHA and never refetched.
+        """
+        cache_path = os.path.join(self.cache_dir, 'commits', sha[:2], f'{sha}.json')
+        cached = await asyncio.to_thread(self._read_cache, cache_path)
+        if cached is not None:
+            return cached
+        
+        response = await self._get(f'{self.base_url}/repos/{org}/{repo}/commits/{sha}')
+        if response.status_code != 200:
+            logger.warning(f"Failed to get stats for commit {sha[:7]}: {response.text}")
+            return None
+        
+        # Keep only the stats; full commit bodies include file patches and can be large
+        detail = orjson.loads(response.content)
+        stats = {'sha': sha, 'stats': detail['stats']}
+        await asyncio.to_thread(self._write_cache, cache_path, stats)
+        return stats
+
+    async def _get_user_id(self, username: str) -> str:
+        """Resolve a login to the GraphQL node ID used for author filtering. Results are cached per user."""
+        return await self._memoized(self._user_id_cache, username, lambda: self._lookup_user_id(username))
+
+    async def _lookup_user_id(self, username: str) -> str:
+        """Look up the GraphQL node ID of a login."""
+        response = await self._get(f'{self.base_url}/users/{username}')
+        if response.status_code != 200:
+            text = response.text
+            logger.error(f"Failed to fetch user {username}: {text}")
+            raise Exception(f"Failed to fetch user {username}: {text}")
+        return orjson.loads(response.content)['node_id']
+
+    async def _fetch_repo_history(self, org: str, repo: str, author_id: str,
+                                  start_date: datetime, end_date: datetime) -> Optional[List[Dict]]:
+        """Get a user's commits with their stats in one repository via GraphQL.
+
+        Returns None if the query failed, so the caller can fall back to REST.
+        """
+        records = []
+        variables = {
+            'owner': org,
+            'name': repo,
+            'author': author_id,
+            'since': start_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'until': end_date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'cursor': None
+        }
+        while True:
+            data = await self._graphql(COMMIT_HISTORY_QUERY, variables)
+            if data is None:
+                return None
+            
+            branch = data['repository'] and data['repository']['defaultBranchRef']
+            if not branch:
+                # Empty repository
+                break
+            
+            history = branch['target']['history']
+            for node in history['nodes']:
+                records.append({
+                    'sha': node['oid'],
+                    'repo': repo,
+                    'date': node['authoredDate'],
+                    'additions': node['additions'],
+                    'deletions': node['deletions']
+                })
+            if not history['pageInfo']['hasNextPage']:
+                break
+            variables['cursor'] = history['pageInfo']['endCursor']
+        
+        logger.info(f"Found {len(records)} commits in {repo}")
+        return records
+
+    async def _fetch_repo_records_rest(self, org: str, repo: str, username: str,
+                                       start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Get a user's commits with their stats in one repository via the REST API."""
+        commits = await self._fetch_repo_commits(org, repo, username, start_date, end_date)
+        details = await asyncio.gather(*[
+            self._fetch_commit_detail(org, repo, commit['sha']) for commit in commits
+        ])
+        
+        records = []
+        for commit, detail in zip(commits, details):
+            if detail is None:
+                continue
+            records.append({
+                'sha': commit['sha'],
+                'repo': repo,
+                'date': commit['commit']['author']['date'],
+                'additions': detail['stats']['additions'],
+                'deletions': detail['stats']['deletions']
+            })
+        return records
+
+    async def _fetch_repo_records(self, org: str, repo: str, username: str, author_id: str,
+                                  start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Get a user's commits with their stats in one repository, preferring GraphQL."""
+        records = await self._fetch_repo_history(org, repo, author_id, start_date, end_date)
+        if records is None:
+            logger.warning(f"Falling back to REST API for {repo}")
+            records = await self._fetch_repo_records_rest(org, repo, username, start_date, end_date)
+        return records
+
+    @staticmethod
+    def month_range(year: int, month: int) -> Tuple[datetime, datetime]:
+        """Get the start of a month and the start of the following month."""
         start_date = datetime(year, month, 1)
         if month == 12:
             end_date = datetime(year + 1, 1, 1)
         else:
             end_date = datetime(year, month + 1, 1)
+        return start_date, end_date
+
+    async def get_commit_stats_range(self, org: str, username: str,
+                                     start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Get a user's commits with their additions and deletions within a date range."""
+        logger.info(f"Fetching commits for {username} in {org} from {start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}")
+        repos, author_id = await asyncio.gather(
+            self._get_active_repos(org, username, start_date, end_date),
+            self._get_user_id(username)
+        )
+        results = await asyncio.gather(*[
+            self._fetch_repo_records(org, repo, username, author_id, start_date, end_date)
+            for repo in repos
+        ])
+        records = list(itertools.chain.from_iterable(results))
+        logger.info(f"Total commits found: {len(records)}")
         
-        commits = self.get_user_commits(org, username, start_date, end_date)
-        
-        total_additions = 0
-        total_deletions = 0
-        repo_stats = defaultdict(lambda: {'additions': 0, 'deletions': 0, 'commits': 0})
-        daily_stats = defaultdict(lambda: {'additions': 0, 'deletions': 0, 'commits': 0})
-        commit_times = []
-        
-        logger.info(f"Processing {len(commits)} commits for detailed stats")
-        for i, commit in enumerate(commits, 1):
-            commit_sha = commit['sha']
-            commit_url = commit['url']
-            repo_name = commit_url.split('/repos/')[1].split('/commits/')[0].split('/')[-1]
-            commit_date = datetime.strptime(commit['commit']['author']['date'], '%Y-%m-%dT%H:%M:%SZ')
-            commit_times.append(commit_date)
-            
-            logger.info(f"Processing commit {i}/{len(commits)}: {commit_sha[:7]} in {repo_name}")
-            
-            response = requests.get(
-                f'{self.base_url}/repos/{org}/{repo_name}/commits/{commit_sha}',
-                headers=self.headers
-            )
-            
-            if response.status_code == 200:
-                stats = response.json()
-                additions = stats['stats']['additions']
-                deletions = stats['stats']['deletions']
-                total_additions += additions
-                total_deletions += deletions
-                
-                # Update repository stats
-                repo_stats[repo_name]['additions'] += additions
-                repo_stats[repo_name]['deletions'] += deletions
-                repo_stats[repo_name]['commits'] += 1
-                
-                # Update daily stats
-                day_key = commit_date.strftime('%Y-%m-%d')
-                daily_stats[day_key]['additions'] += additions
-                daily_stats[day_key]['deletions'] += deletions
-                daily_stats[day_key]['commits'] += 1
-                
-                logger.info(f"Commit {commit_sha[:7]}: +{additions} -{deletions}")
-            else:
-                logger.warning(f"Failed to get stats for commit {commit_sha[:7]}: {response.text}")
+        # Commit dates stay ISO-8601 strings until here and are parsed in one vectorized pass
+        df = pd.DataFrame.from_records(
+            records, columns=['sha', 'repo', 'date', 'additions', 'deletions']
+        ).astype({'additions': 'int64', 'deletions': 'int64'})
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%dT%H:%M:%SZ')
         
+        if logger.isEnabledFor(logging.DEBUG):
+            for commit in df.itertuples():
+                logger.debug(f"Commit {commit.sha[:7]} in {commit.repo}: +{commit.additions} -{commit.deletions}")
+        return df
+
+    async def get_commit_stats(self, org: str, username: str, year: int, month: int) -> Tuple[int, int, Dict]:
+        """Get total additions and deletions for a user in a specific month."""
+        logger.info(f"Calculating stats for {username} in {org} for {year}-{month}")
+        start_date, end_date = self.month_range(year, month)
+        df = await self.get_commit_stats_range(org, username, start_date, end_date)
+        return self.summarize_commits(df)
+
+    def summarize_commits(self, df: pd.DataFrame) -> Tuple[int, int, Dict]:
+        """Aggregate a commits frame into total additions, deletions and detailed stats."""
+        total_additions = int(df['additions'].sum())
+        total_deletions = int(df['deletions'].sum())
+        empty = {'additions': 0, 'deletions': 0, 'commits': 0}
+        # 1970-01-01 was a Thursday, so shifting day numbers by 3 puts Saturday and Sunday at 5 and 6
+        days = df['date'].to_numpy().astype('datetime64[D]').astype('int64')
+        week_split = self._group_totals(df, (days + 3) % 7 >= 5)
         logger.info(f"Final stats: +{total_additions} -{total_deletions}")
         return total_additions, total_deletions, {
-            'repo_stats': dict(repo_stats),
-            'daily_stats': dict(daily_stats),
-            'commit_times': commit_times
+            'repo_stats': self._group_totals(df, df['repo']),
+            'daily_stats': self._group_totals(df, df['date'].dt.normalize()),
+            'weekend_stats': week_split.get(True, empty),
+            'weekday_stats': week_split.get(False, empty),
+            'commit_times': df['date'].tolist(),
+            'commits': df
+        }
+
+    @staticmethod
+    def _group_totals(df: pd.DataFrame, key: Union[pd.Series, np.ndarray]) -> Dict[Any, Dict[str, int]]:
+        """Sum additions, deletions and commit counts of a commits frame per key."""
+        # Accumulate into one preallocated int64 row per distinct key, indexed by its factorized code
+        codes, keys = pd.factorize(key, sort=True)
+        totals = np.zeros((len(keys), 3), dtype=np.int64)
+        totals[:, 0] = np.bincount(codes, weights=df['additions'].to_numpy(), minlength=len(keys))
+        totals[:, 1] = np.bincount(codes, weights=df['deletions'].to_numpy(), minlength=len(keys))
+        totals[:, 2] = np.bincount(codes, minlength=len(keys))
+        return {
+            k: {'additions': additions, 'deletions': deletions, 'commits': commits}
+            for k, (additions, deletions, commits) in zip(keys.tolist(), totals.tolist())
         }
 
     def analyze_productivity(self, current_stats: Dict, previous_stats: Dict) -> Dict:
@@ -165,22 +549,16 @@ class GitHubStats:
         current_daily_avg = current_total / len(current_stats['daily_stats']) if current_stats['daily_stats'] else 0
         previous_daily_avg = previous_total / len(previous_stats['daily_stats']) if previous_stats['daily_stats'] else 0
         
-        # Calculate weekend vs weekday activity
-        weekend_changes = 0
-        weekday_changes = 0
-        for day, stats in current_stats['daily_stats'].items():
-            date = datetime.strptime(day, '%Y-%m-%d')
-            if date.weekday() >= 5:  # Weekend
-                weekend_changes += stats['additions'] + stats['deletions']
-            else:
-                weekday_changes += stats['additions'] + stats['deletions']
+        # Weekend vs weekday activity is split during aggregation
+        weekend_changes = current_stats['weekend_stats']['additions'] + current_stats['weekend_stats']['deletions']
+        weekday_changes = current_stats['weekday_stats']['additions'] + current_stats['weekday_stats']['deletions']
         
         # Calculate commit frequency
         commit_times = current_stats['commit_times']
         if len(commit_times) > 1:
-            commit_intervals = [(commit_times[i] - commit_times[i-1]).total_seconds() 
-                              for i in range(1, len(commit_times))]
-            avg_commit_interval = statistics.mean(commit_intervals)
+            # Commits arrive grouped by repository, so sort before taking intervals
+            times = np.sort(np.asarray(commit_times, dtype='datetime64[s]'))
+            avg_commit_interval = float(np.diff(times).astype('int64').mean())
             commits_per_day = len(commit_times) / len(current_stats['daily_stats'])
         else:
             avg_commit_interval = 0
@@ -206,6 +584,8 @@ class GitHubStats:
         }
 
 def main():
+    import calendar
+
     token = os.getenv('GITHUB_TOKEN')
     if not token:
         print("Please set GITHUB_TOKEN environment variable")
@@ -218,19 +598,30 @@ def main():
     year = int(input("Enter year (YYYY): "))
     month = int(input("Enter month (1-12): "))
     
+    if month == 1:
+        prev_year, prev_month = year - 1, 12
+    else:
+        prev_year, prev_month = year, month - 1
+    
+    # Fetch both months in one pass and split them in memory
+    month_start, month_end = GitHubStats.month_range(year, month)
+    prev_month_start, _ = GitHubStats.month_range(prev_year, prev_month)
+    
+    async def collect_commits():
+        try:
+            return await stats.get_commit_stats_range(org, username, prev_month_start, month_end)
+        finally:
+            await stats.close()
+    
     try:
         logger.info("Starting stats calculation...")
         
-        # Get current month stats
-        current_additions, current_deletions, current_stats = stats.get_commit_stats(org, username, year, month)
+        with queued_logging():
+            commits = asyncio.run(collect_commits())
         
-        # Get previous month stats
-        if month == 1:
-            prev_year, prev_month = year - 1, 12
-        else:
-            prev_year, prev_month = year, month - 1
-            
-        prev_additions, prev_deletions, prev_stats = stats.get_commit_stats(org, username, prev_year, prev_month)
+        in_current_month = commits['date'] >= month_start
+        current_additions, current_deletions, current_stats = stats.summarize_commits(commits[in_current_month])
+        prev_additions, prev_deletions, prev_stats = stats.summarize_commits(commits[~in_current_month])
         
         # Calculate productivity metrics
         productivity = stats.analyze_productivity(
@@ -276,5 +667,10 @@ def main():
         print(f"Error: {str(e)}")
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not when imported as a library
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     main()
  
\ No newline at end of file